@@ -1,10 +1,109 @@
+import os
+
+# Select the native pycryptodome keccak backend for eth-hash before web3
+# is imported; the pure-python fallback backend is ~20x slower.
+try:
+    import Crypto  # noqa: F401
+    os.environ.setdefault("ETH_HASH_BACKEND", "pycryptodome")
+except ImportError:
+    pass
+
 from web3 import Web3
+from web3._utils.abi import get_abi_output_types
+from web3.datastructures import AttributeDict
+from hexbytes import HexBytes
+import asyncio
+import functools
 import json
-import os
-from typing import Dict, List, Optional
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter, Retry
+from cachetools import LRUCache, TTLCache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import logging
 
+try:
+    from Crypto.Hash import keccak as _pycryptodome_keccak
+
+    @functools.lru_cache(maxsize=8192)
+    def _keccak_text(text: str) -> bytes:
+        """Keccak-256 of a UTF-8 string via the native pycryptodome backend"""
+        return _pycryptodome_keccak.new(data=text.encode('utf-8'), digest_bits=256).digest()
+except ImportError:
+    from eth_hash.auto import keccak as _auto_keccak
+
+    @functools.lru_cache(maxsize=8192)
+    def _keccak_text(text: str) -> bytes:
+        """Keccak-256 of a UTF-8 string via the default eth-hash backend"""
+        return _auto_keccak(text.encode('utf-8'))
+
+
+@functools.lru_cache(maxsize=8192)
+def _hex_to_bytes(value: str) -> bytes:
+    """Cached conversion of a 0x-prefixed hex string to raw bytes"""
+    return bytes.fromhex(value[2:])
+
+
+@functools.lru_cache(maxsize=8192)
+def _to_checksum(address: str) -> str:
+    """EIP-55 checksum an address, memoized.
+
+    The app stores addresses lowercased while web3 wants checksummed
+    input; the wallet pool is small and highly repeated, so the keccak
+    behind the checksum amortizes to a dict probe.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def _to_bytes32(value) -> bytes:
+    """Normalize a hash argument to bytes32.
+
+    A 0x-prefixed 64-hex-digit string is already a digest and is decoded
+    directly; anything else is keccak-hashed into one.
+    """
+    if isinstance(value, bytes):
+        return value
+    if len(value) == 66 and value.startswith('0x'):
+        try:
+            return _hex_to_bytes(value)
+        except ValueError:
+            pass  # Not actually hex; fall through to hashing
+    return _keccak_text(value)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_deployment_info(path: str, mtime: float) -> Dict:
+    """Parse the deployment file once per file version (keyed by mtime)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# Field order mirrors the Transaction struct in AuditTrail.sol
+_TRAIL_FIELDS = (
+    "tokenId", "smeAddress", "timestamp", "transactionType",
+    "amount", "dataHash", "ipfsHash", "isVerified"
+)
+
+
+def _format_transaction(tx) -> Dict:
+    """Format an on-chain transaction tuple as a response dict.
+
+    dataHash is declared bytes32 in the ABI, so the decoder always hands
+    back bytes and it can be hex-encoded unconditionally.
+    """
+    formatted = dict(zip(_TRAIL_FIELDS, tx))
+    formatted["dataHash"] = formatted["dataHash"].hex()
+    return formatted
+
 # Load environment variables
 load_dotenv()
 
@@ -12,13 +111,134 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class _ReceiptWaiter:
+    """Resolves pending transaction receipts from a single shared poll loop.
+
+    Instead of every in-flight transaction polling the node on its own,
+    all pending hashes are registered here and a single background task
+    issues one batched eth_getTransactionReceipt lookup per new block,
+    waking the matching futures as receipts appear.
+    """
+
+    def __init__(self, service: "BlockchainService", poll_latency: float = 1.0):
+        self._service = service
+        self._poll_latency = poll_latency
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait_for(self, tx_hash, timeout: float = 120):
+        """Register a transaction hash and wait for its receipt"""
+        loop = asyncio.get_running_loop()
+        key = tx_hash.hex() if not isinstance(tx_hash, str) else tx_hash
+
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+
+        # Lazily (re)start the shared poll loop
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._receipt_loop())
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(key, None)
+            raise TimeoutError(f"Transaction {key} not mined within {timeout} seconds")
+
+    async def _receipt_loop(self):
+        """Poll new blocks and resolve all pending receipts in one batch.
+
+        The RPC calls here are synchronous requests under the hood, so
+        they run through asyncio.to_thread — a slow or hung node must
+        never stall the event loop for every in-flight request.
+        """
+        last_block = -1
+        while self._pending:
+            try:
+                current_block = await asyncio.to_thread(
+                    lambda: self._service.w3.eth.block_number
+                )
+                if current_block != last_block:
+                    last_block = current_block
+                    hashes = list(self._pending.keys())
+                    if hashes:
+                        raw_receipts = await asyncio.to_thread(
+                            self._fetch_receipts, hashes
+                        )
+                        self._resolve_pending(hashes, raw_receipts)
+            except Exception as e:
+                logger.warning(f"Receipt poll failed: {str(e)}")
+            await asyncio.sleep(self._poll_latency)
+
+    def _fetch_receipts(self, hashes: List[str]) -> List:
+        """Fetch receipts for the given hashes in a single RPC round-trip.
+
+        Blocking; runs in a worker thread from _receipt_loop.
+        """
+        return self._service._batch_rpc([
+            ("eth_getTransactionReceipt", [tx_hash]) for tx_hash in hashes
+        ])
+
+    def _resolve_pending(self, hashes: List[str], raw_receipts: List):
+        """Wake the futures of mined receipts; runs on the event loop"""
+        for tx_hash, raw in zip(hashes, raw_receipts):
+            if raw is None:
+                continue  # Not mined yet
+
+            future = self._pending.pop(tx_hash, None)
+            if future is None or future.done():
+                continue
+
+            future.set_result(AttributeDict({
+                "transactionHash": HexBytes(raw["transactionHash"]),
+                "blockNumber": int(raw["blockNumber"], 16),
+                "gasUsed": int(raw["gasUsed"], 16),
+                "status": int(raw["status"], 16) if raw.get("status") is not None else None,
+                "contractAddress": raw.get("contractAddress")
+            }))
+
+
 class BlockchainService:
     """Service for interacting with the AuditTrail smart contract"""
     
     def __init__(self):
-        # Connect to Ethereum network
+        # Connect to Ethereum network over a pooled keep-alive session so
+        # RPC calls reuse TCP/TLS connections instead of reconnecting
         self.rpc_url = os.getenv('ETHEREUM_RPC_URL', 'http://127.0.0.1:8545')
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        self._rpc_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self._rpc_session.mount('http://', adapter)
+        self._rpc_session.mount('https://', adapter)
+
+        self.w3 = Web3(Web3.HTTPProvider(
+            self.rpc_url,
+            session=self._rpc_session,
+            request_kwargs={'timeout': 10}
+        ))
+
+        # Shared receipt waiter (one poll loop for all pending transactions)
+        self._receipt_waiter = _ReceiptWaiter(self)
+
+        # Short-lived read caches (~1 block): authorization flips rarely and
+        # transaction counts only change when this service itself writes
+        self._auth_cache = TTLCache(maxsize=1024, ttl=12)
+        self._count_cache = TTLCache(maxsize=1024, ttl=12)
+
+        # Audit trails keyed by (sme_address, block number at fetch): chain
+        # state at a given block is immutable, so reads within the same
+        # block can be answered from memory
+        self._trail_cache = LRUCache(maxsize=32)
+
+        # Confirmation status of pipelined submissions, keyed by tx hash.
+        # TTL-bounded: nothing ever removes terminal entries explicitly,
+        # so a plain dict would grow with every submission for the life
+        # of the process. An hour is ample for callers to poll a result.
+        self._submitted: TTLCache = TTLCache(maxsize=10000, ttl=3600)
         
         # Check connection
         if not self.w3.is_connected():
@@ -41,20 +261,32 @@ class BlockchainService:
         )
         
         try:
-            with open(deployment_file, 'r') as f:
-                deployment_info = json.load(f)
-            
+            deployment_info = _load_deployment_info(
+                deployment_file, os.path.getmtime(deployment_file)
+            )
+
             self.contract_address = deployment_info['address']
             self.contract_abi = deployment_info['abi']
-            
+
             # Initialize contract instance
             self.contract = self.w3.eth.contract(
                 address=self.contract_address,
                 abi=self.contract_abi
             )
-            
+
+            # Bind function factories once; attribute access on
+            # contract.functions rebuilds ContractFunction objects per call
+            functions = self.contract.functions
+            self._fn_authorize_sme = functions.authorizeSME
+            self._fn_log_transaction = functions.logTransaction
+            self._fn_get_audit_trail = functions.getAuditTrail
+            self._fn_verify_token = functions.verifyToken
+            self._fn_verify_data_integrity = functions.verifyDataIntegrity
+            self._fn_get_transaction_count = functions.getTransactionCount
+            self._fn_is_authorized_sme = functions.isAuthorizedSME
+
             logger.info(f"📋 Contract loaded: {self.contract_address}")
-            
+
         except FileNotFoundError:
             raise FileNotFoundError(
                 "Smart contract deployment file not found. "
@@ -80,53 +312,122 @@ class BlockchainService:
                 logger.info(f"🔑 Using local account: {self.account_address}")
             else:
                 raise ValueError("No accounts available and no private key provided")
-    
-    def _get_transaction_params(self) -> Dict:
-        """Get standard transaction parameters"""
+
+        # Cache the chain id and track nonces in memory per sender so
+        # building a transaction needs no RPC round-trips
+        self._chain_id = self.w3.eth.chain_id
+        self._nonces: Dict[str, int] = {}
+
+        # Precompute the immutable base transaction parameters once; the
+        # gas price conversion in particular is surprisingly costly per call
         if self.account:
-            # Using private key account
-            return {
+            self._base_tx_params = MappingProxyType({
                 'from': self.account.address,
                 'gas': 500000,
                 'gasPrice': self.w3.to_wei('20', 'gwei')
-            }
+            })
         else:
-            # Using local account
-            return {
+            self._base_tx_params = MappingProxyType({
                 'from': self.account_address,
                 'gas': 500000
-            }
+            })
+
+    def _get_transaction_params(self) -> Dict:
+        """Get standard transaction parameters"""
+        return dict(self._base_tx_params)
+
+    def _next_nonce(self, sender: str) -> int:
+        """Return the next nonce for a sender, re-synced from the node.
+
+        The pending count from the node covers transactions submitted by
+        other workers or externally from the same address; the locally
+        tracked counter covers our own pipelined submissions the node may
+        not have pooled yet. Taking the max keeps both in step without a
+        process-local counter drifting ahead of reality.
+        """
+        pending = self.w3.eth.get_transaction_count(sender, 'pending')
+        nonce = max(pending, self._nonces.get(sender, 0))
+        self._nonces[sender] = nonce + 1
+        return nonce
+
+    def _build_transaction(self, contract_fn, tx_params: Dict) -> Dict:
+        """Assemble a transaction dict without the build_transaction RPCs.
+
+        build_transaction issues eth_estimateGas and
+        eth_getTransactionCount on every call; with gas fixed by the base
+        params and the chain id cached at init, only the nonce re-sync in
+        _next_nonce still touches the node.
+        """
+        transaction = dict(tx_params)
+        transaction.update({
+            'to': self.contract_address,
+            'data': contract_fn._encode_transaction_data(),
+            'chainId': self._chain_id,
+            'nonce': self._next_nonce(transaction['from'])
+        })
+        return transaction
     
-    def _send_transaction(self, transaction):
-        """Send and wait for transaction confirmation"""
-        if self.account:
-            # Sign and send transaction with private key
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, self.account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        else:
+    async def _wait_for_receipt(self, tx_hash, timeout: float = 120):
+        """Wait for a transaction receipt via the shared receipt waiter"""
+        return await self._receipt_waiter.wait_for(tx_hash, timeout)
+
+    def _submit_transaction(self, transaction):
+        """Send a transaction and return its hash without waiting for mining"""
+        try:
+            if self.account:
+                # Sign and send transaction with private key
+                signed_txn = self.w3.eth.account.sign_transaction(transaction, self.account.key)
+                return self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
             # Send transaction directly (local development)
-            tx_hash = self.w3.eth.send_transaction(transaction)
-        
-        # Wait for transaction receipt
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            return self.w3.eth.send_transaction(transaction)
+        except Exception:
+            # Locally tracked nonce may now be out of step with the node
+            self._nonces.pop(transaction.get('from'), None)
+            raise
+
+    async def _send_transaction(self, transaction):
+        """Send and wait for transaction confirmation"""
+        # Sign/send is a blocking HTTP call; keep it off the event loop
+        tx_hash = await asyncio.to_thread(self._submit_transaction, transaction)
+
+        # Wait for transaction receipt (cooperative poll instead of the
+        # blocking wait_for_transaction_receipt, so concurrent submissions
+        # can overlap while their transactions are being mined)
+        receipt = await self._wait_for_receipt(tx_hash)
         return receipt
+
+    async def _reconcile_submission(self, tx_hash):
+        """Background task resolving the receipt of a pipelined submission"""
+        key = tx_hash.hex()
+        try:
+            receipt = await self._wait_for_receipt(tx_hash)
+            self._submitted[key] = {
+                "status": "confirmed",
+                "block_number": receipt.blockNumber,
+                "gas_used": receipt.gasUsed
+            }
+        except Exception as e:
+            self._submitted[key] = {"status": "failed", "error": str(e)}
     
     async def authorize_sme(self, sme_address: str, status: bool = True) -> Dict:
         """Authorize or deauthorize an SME on the blockchain"""
         try:
             logger.info(f"🔐 Authorizing SME: {sme_address} -> {status}")
             
-            # Build transaction
+            # Build transaction (no estimate_gas / nonce round-trips)
             tx_params = self._get_transaction_params()
-            transaction = self.contract.functions.authorizeSME(
-                sme_address, status
-            ).build_transaction(tx_params)
+            transaction = self._build_transaction(
+                self._fn_authorize_sme(_to_checksum(sme_address), status), tx_params
+            )
             
             # Send transaction
-            receipt = self._send_transaction(transaction)
+            receipt = await self._send_transaction(transaction)
             
             logger.info(f"✅ SME authorization successful: {receipt.transactionHash.hex()}")
-            
+
+            # The cached authorization flag is now stale
+            self._auth_cache.pop(sme_address, None)
+
             return {
                 "success": True,
                 "transaction_hash": receipt.transactionHash.hex(),
@@ -138,6 +439,63 @@ class BlockchainService:
         except Exception as e:
             logger.error(f"❌ SME authorization failed: {str(e)}")
             return {"success": False, "error": str(e)}
+
+    async def authorize_smes(self, sme_addresses: List[str], status: bool = True) -> Dict:
+        """Authorize or deauthorize multiple SMEs in one on-chain call.
+
+        Uses the contract's batchAuthorizeSMEs so N authorizations cost a
+        single transaction; if the deployed contract predates the batch
+        method, the individual transactions are pipelined concurrently
+        instead.
+        """
+        try:
+            logger.info(f"🔐 Batch authorizing {len(sme_addresses)} SMEs -> {status}")
+
+            try:
+                batch_fn = self.contract.get_function_by_name('batchAuthorizeSMEs')
+            except Exception:
+                batch_fn = None
+
+            if batch_fn is None:
+                # Old deployment without the batch method: pipeline the
+                # individual transactions (sequential nonces let them
+                # land in the same block)
+                results = await asyncio.gather(*[
+                    self.authorize_sme(sme_address, status)
+                    for sme_address in sme_addresses
+                ])
+                return {
+                    "success": all(r["success"] for r in results),
+                    "results": results,
+                    "status": status
+                }
+
+            tx_params = self._get_transaction_params()
+            transaction = self._build_transaction(
+                batch_fn([_to_checksum(a) for a in sme_addresses], [status] * len(sme_addresses)),
+                tx_params
+            )
+
+            receipt = await self._send_transaction(transaction)
+
+            logger.info(f"✅ Batch authorization successful: {receipt.transactionHash.hex()}")
+
+            # Cached authorization flags are now stale
+            for sme_address in sme_addresses:
+                self._auth_cache.pop(sme_address, None)
+
+            return {
+                "success": True,
+                "transaction_hash": receipt.transactionHash.hex(),
+                "gas_used": receipt.gasUsed,
+                "block_number": receipt.blockNumber,
+                "status": status,
+                "authorized_count": len(sme_addresses)
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Batch SME authorization failed: {str(e)}")
+            return {"success": False, "error": str(e)}
     
     async def log_transaction(
         self,
@@ -153,65 +511,124 @@ class BlockchainService:
             logger.info(f"📝 Logging transaction: {token_id} for SME: {sme_address}")
             
             # Convert data_hash to bytes32
-            if isinstance(data_hash, str):
-                if data_hash.startswith('0x'):
-                    data_hash_bytes = bytes.fromhex(data_hash[2:])
-                else:
-                    # Convert string to bytes32
-                    data_hash_bytes = self.w3.keccak(text=data_hash)
-            else:
-                data_hash_bytes = data_hash
+            data_hash_bytes = _to_bytes32(data_hash)
             
-            # Build transaction
+            # Build transaction (no estimate_gas / nonce round-trips)
             tx_params = self._get_transaction_params()
-            tx_params['from'] = sme_address  # Transaction should come from SME
-            
-            transaction = self.contract.functions.logTransaction(
-                token_id,
-                transaction_type,
-                amount,
-                data_hash_bytes,
-                ipfs_hash
-            ).build_transaction(tx_params)
+            tx_params['from'] = _to_checksum(sme_address)  # Transaction should come from SME
+
+            transaction = self._build_transaction(
+                self._fn_log_transaction(
+                    token_id,
+                    transaction_type,
+                    amount,
+                    data_hash_bytes,
+                    ipfs_hash
+                ),
+                tx_params
+            )
             
             # Send transaction
-            receipt = self._send_transaction(transaction)
+            receipt = await self._send_transaction(transaction)
             
             logger.info(f"✅ Transaction logged successfully: {receipt.transactionHash.hex()}")
-            
+
+            # Cached count and trail entries for this SME are now stale
+            self._count_cache.pop(sme_address, None)
+            for key in [k for k in self._trail_cache if k[0] == sme_address]:
+                del self._trail_cache[key]
+
             return {
                 "success": True,
                 "transaction_hash": receipt.transactionHash.hex(),
                 "gas_used": receipt.gasUsed,
                 "block_number": receipt.blockNumber,
-                "data_hash": data_hash_bytes.hex() if isinstance(data_hash_bytes, bytes) else data_hash_bytes
+                "data_hash": data_hash_bytes.hex()
             }
             
         except Exception as e:
             logger.error(f"❌ Transaction logging failed: {str(e)}")
             return {"success": False, "error": str(e)}
+
+    async def submit_log_transaction(
+        self,
+        token_id: str,
+        transaction_type: str,
+        amount: int,
+        data_hash: str,
+        ipfs_hash: str,
+        sme_address: str
+    ) -> Dict:
+        """Submit a transaction log without waiting for its receipt.
+
+        Returns as soon as the node accepts the transaction; a background
+        task reconciles the receipt via the shared receipt waiter, and
+        callers can poll get_submission_status with the returned hash.
+        Burst writers can pipeline many transactions into the same block
+        this way instead of paying a full block time each.
+        """
+        try:
+            logger.info(f"📝 Submitting transaction (pipelined): {token_id} for SME: {sme_address}")
+
+            data_hash_bytes = _to_bytes32(data_hash)
+
+            tx_params = self._get_transaction_params()
+            tx_params['from'] = _to_checksum(sme_address)  # Transaction should come from SME
+
+            transaction = self._build_transaction(
+                self._fn_log_transaction(
+                    token_id,
+                    transaction_type,
+                    amount,
+                    data_hash_bytes,
+                    ipfs_hash
+                ),
+                tx_params
+            )
+
+            tx_hash = await asyncio.to_thread(self._submit_transaction, transaction)
+            tx_hash_hex = tx_hash.hex()
+
+            self._submitted[tx_hash_hex] = {"status": "pending"}
+            asyncio.get_running_loop().create_task(self._reconcile_submission(tx_hash))
+
+            # Cached count and trail entries for this SME are now stale
+            self._count_cache.pop(sme_address, None)
+            for key in [k for k in self._trail_cache if k[0] == sme_address]:
+                del self._trail_cache[key]
+
+            return {
+                "success": True,
+                "transaction_hash": tx_hash_hex,
+                "status": "pending",
+                "data_hash": data_hash_bytes.hex()
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Transaction submission failed: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    def get_submission_status(self, tx_hash: str) -> Dict:
+        """Get the confirmation status of a pipelined submission"""
+        return self._submitted.get(tx_hash, {"status": "unknown"})
     
     async def get_audit_trail(self, sme_address: str) -> List[Dict]:
         """Retrieve complete audit trail for an SME from blockchain"""
         try:
             logger.info(f"📖 Retrieving audit trail for SME: {sme_address}")
-            
-            trail = self.contract.functions.getAuditTrail(sme_address).call()
-            
-            formatted_trail = []
-            for tx in trail:
-                formatted_tx = {
-                    "tokenId": tx[0],
-                    "smeAddress": tx[1],
-                    "timestamp": tx[2],
-                    "transactionType": tx[3],
-                    "amount": tx[4],
-                    "dataHash": tx[5].hex() if isinstance(tx[5], bytes) else tx[5],
-                    "ipfsHash": tx[6],
-                    "isVerified": tx[7]
-                }
-                formatted_trail.append(formatted_tx)
-            
+
+            head_block = self.w3.eth.block_number
+            cached_trail = self._trail_cache.get((sme_address, head_block))
+            if cached_trail is not None:
+                logger.info(f"📊 Serving audit trail from block {head_block} cache")
+                return cached_trail
+
+            trail = self._fn_get_audit_trail(_to_checksum(sme_address)).call()
+
+            formatted_trail = [_format_transaction(tx) for tx in trail]
+
+            self._trail_cache[(sme_address, head_block)] = formatted_trail
+
             logger.info(f"📊 Retrieved {len(formatted_trail)} transactions")
             return formatted_trail
             
@@ -223,25 +640,25 @@ class BlockchainService:
         """Verify a token's existence and authenticity on blockchain"""
         try:
             logger.info(f"🔍 Verifying token: {token_id} for SME: {sme_address}")
-            
-            result = self.contract.functions.verifyToken(token_id, sme_address).call()
+
+            # A trail cached at the current head block is a complete listing
+            # for the SME, so it can answer the verification without an RPC
+            cached_trail = self._trail_cache.get((sme_address, self.w3.eth.block_number))
+            if cached_trail is not None:
+                for cached_tx in cached_trail:
+                    if cached_tx["tokenId"] == token_id:
+                        return {"exists": True, "transaction": cached_tx}
+                return {"exists": False, "transaction": None}
+
+            result = self._fn_verify_token(token_id, _to_checksum(sme_address)).call()
             exists = result[0]
             transaction_data = result[1] if exists else None
-            
+
             if exists and transaction_data:
-                formatted_transaction = {
-                    "tokenId": transaction_data[0],
-                    "smeAddress": transaction_data[1],
-                    "timestamp": transaction_data[2],
-                    "transactionType": transaction_data[3],
-                    "amount": transaction_data[4],
-                    "dataHash": transaction_data[5].hex() if isinstance(transaction_data[5], bytes) else transaction_data[5],
-                    "ipfsHash": transaction_data[6],
-                    "isVerified": transaction_data[7]
-                }
+                formatted_transaction = _format_transaction(transaction_data)
             else:
                 formatted_transaction = None
-            
+
             logger.info(f"🔍 Token verification result: {exists}")
             
             return {
@@ -253,6 +670,112 @@ class BlockchainService:
             logger.error(f"❌ Token verification failed: {str(e)}")
             return {"exists": False, "error": str(e)}
     
+    def _batch_rpc(self, requests_: List[Tuple[str, List]]) -> List:
+        """Execute multiple JSON-RPC requests in a single batch round-trip"""
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(requests_)
+        ]
+
+        response = self._rpc_session.post(self.rpc_url, json=payload, timeout=30)
+        response.raise_for_status()
+
+        # Responses may arrive out of order; re-index by request id
+        results_by_id = {item["id"]: item for item in response.json()}
+
+        results = []
+        for i, (method, _) in enumerate(requests_):
+            item = results_by_id[i]
+            if "error" in item:
+                raise ValueError(f"Batched {method} failed: {item['error']}")
+            results.append(item["result"])
+
+        return results
+
+    def _batch_eth_call(self, calls: List[Tuple[str, List]]) -> List:
+        """Execute multiple read-only contract calls in a single JSON-RPC batch request"""
+        raw_results = self._batch_rpc([
+            (
+                "eth_call",
+                [
+                    {
+                        "to": self.contract_address,
+                        "data": self.contract.encodeABI(fn_name=fn_name, args=args)
+                    },
+                    "latest"
+                ]
+            )
+            for fn_name, args in calls
+        ])
+
+        decoded_results = []
+        for (fn_name, _), raw in zip(calls, raw_results):
+            fn_abi = self.contract.get_function_by_name(fn_name).abi
+            output_types = get_abi_output_types(fn_abi)
+            decoded = self.w3.codec.decode(output_types, bytes.fromhex(raw[2:]))
+            decoded_results.append(decoded[0] if len(decoded) == 1 else decoded)
+
+        return decoded_results
+
+    async def batch_verify_tokens(self, pairs: List[Tuple[str, str]]) -> List[Dict]:
+        """Verify multiple (token_id, sme_address) pairs in one RPC round-trip"""
+        try:
+            logger.info(f"🔍 Batch verifying {len(pairs)} tokens")
+
+            results = self._batch_eth_call([
+                ("verifyToken", [token_id, _to_checksum(sme_address)])
+                for token_id, sme_address in pairs
+            ])
+
+            verifications = []
+            for result in results:
+                exists = result[0]
+                transaction_data = result[1] if exists else None
+
+                verifications.append({
+                    "exists": exists,
+                    "transaction": _format_transaction(transaction_data)
+                    if exists and transaction_data else None
+                })
+
+            return verifications
+
+        except Exception as e:
+            logger.error(f"❌ Batch token verification failed: {str(e)}")
+            return [{"exists": False, "error": str(e)} for _ in pairs]
+
+    async def get_tokens_by_id(
+        self, token_ids: List[str], sme_address: str
+    ) -> Dict[str, Dict]:
+        """Fetch specific tokens for an SME in one batched RPC round-trip.
+
+        Bounds on-chain work to the tokens actually requested (e.g. one
+        result page) instead of downloading the SME's whole trail.
+        """
+        if not token_ids:
+            return {}
+
+        verifications = await self.batch_verify_tokens(
+            [(token_id, sme_address) for token_id in token_ids]
+        )
+
+        return {
+            token_id: verification["transaction"]
+            for token_id, verification in zip(token_ids, verifications)
+            if verification.get("exists") and verification.get("transaction")
+        }
+
+    async def batch_get_counts(self, sme_addresses: List[str]) -> Dict[str, int]:
+        """Get transaction counts for multiple SMEs in one RPC round-trip"""
+        try:
+            counts = self._batch_eth_call([
+                ("getTransactionCount", [_to_checksum(address)]) for address in sme_addresses
+            ])
+            return dict(zip(sme_addresses, counts))
+        except Exception as e:
+            logger.error(f"❌ Batch transaction count failed: {str(e)}")
+            return {address: 0 for address in sme_addresses}
+
     async def verify_data_integrity(
         self, 
         token_id: str, 
@@ -264,16 +787,10 @@ class BlockchainService:
             logger.info(f"🔐 Verifying data integrity for token: {token_id}")
             
             # Convert expected_hash to bytes32 if needed
-            if isinstance(expected_hash, str):
-                if expected_hash.startswith('0x'):
-                    expected_hash_bytes = bytes.fromhex(expected_hash[2:])
-                else:
-                    expected_hash_bytes = self.w3.keccak(text=expected_hash)
-            else:
-                expected_hash_bytes = expected_hash
+            expected_hash_bytes = _to_bytes32(expected_hash)
             
-            is_valid = self.contract.functions.verifyDataIntegrity(
-                token_id, sme_address, expected_hash_bytes
+            is_valid = self._fn_verify_data_integrity(
+                token_id, _to_checksum(sme_address), expected_hash_bytes
             ).call()
             
             logger.info(f"🔐 Data integrity check result: {is_valid}")
@@ -291,16 +808,22 @@ class BlockchainService:
     async def get_transaction_count(self, sme_address: str) -> int:
         """Get total number of transactions for an SME"""
         try:
-            count = self.contract.functions.getTransactionCount(sme_address).call()
+            count = self._count_cache.get(sme_address)
+            if count is None:
+                count = self._fn_get_transaction_count(_to_checksum(sme_address)).call()
+                self._count_cache[sme_address] = count
             return count
         except Exception as e:
             logger.error(f"❌ Failed to get transaction count: {str(e)}")
             return 0
-    
+
     async def is_sme_authorized(self, sme_address: str) -> bool:
         """Check if an SME is authorized on the blockchain"""
         try:
-            is_authorized = self.contract.functions.isAuthorizedSME(sme_address).call()
+            is_authorized = self._auth_cache.get(sme_address)
+            if is_authorized is None:
+                is_authorized = self._fn_is_authorized_sme(_to_checksum(sme_address)).call()
+                self._auth_cache[sme_address] = is_authorized
             return is_authorized
         except Exception as e:
             logger.error(f"❌ Failed to check SME authorization: {str(e)}")
@@ -309,14 +832,35 @@ class BlockchainService:
     def get_network_info(self) -> Dict:
         """Get current network information"""
         try:
+            # One batched round-trip instead of four sequential RPC calls
+            version, chain_id, block_number, gas_price = self._batch_rpc([
+                ("net_version", []),
+                ("eth_chainId", []),
+                ("eth_blockNumber", []),
+                ("eth_gasPrice", [])
+            ])
+
             return {
-                "network_id": self.w3.net.version,
-                "chain_id": self.w3.eth.chain_id,
-                "latest_block": self.w3.eth.block_number,
-                "gas_price": self.w3.eth.gas_price,
+                "network_id": version,
+                "chain_id": int(chain_id, 16),
+                "latest_block": int(block_number, 16),
+                "gas_price": int(gas_price, 16),
                 "contract_address": self.contract_address,
-                "connected": self.w3.is_connected()
+                "connected": True
             }
         except Exception as e:
             logger.error(f"❌ Failed to get network info: {str(e)}")
-            return {"connected": False, "error": str(e)}
\ No newline at end of file
+            return {"connected": False, "error": str(e)}
+
+
+# Shared service instance, created lazily so importing this module does
+# not open an RPC connection
+_service: Optional[BlockchainService] = None
+
+
+def get_blockchain_service() -> BlockchainService:
+    """Return the process-wide BlockchainService, creating it on first use"""
+    global _service
+    if _service is None:
+        _service = BlockchainService()
+    return _service
\ No newline at end of file
@@ -1,25 +1,30 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, BackgroundTasks, Path, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPBearer
+from sqlalchemy import text, select, func, case, insert, cast, Float
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
+from collections import namedtuple
+import asyncio
 import os
-import json
+import hashlib
 import logging
-from datetime import datetime, timedelta
+import tempfile
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 import ipfshttpclient
+from cachetools import TTLCache
 from contextlib import asynccontextmanager
 
 # Import our modules
-from models import Base, SME, Transaction, AuditLog
-from database import engine, get_db, init_database
-from blockchain_service import BlockchainService
+from models import SME, Transaction, AuditLog
+from database import get_async_db, AsyncSessionLocal, init_database
+from blockchain_service import get_blockchain_service
 from tokenization_service import TokenizationService
 from pydantic_models import (
-    SMERegistration, 
-    SMEResponse, 
-    TransactionResponse, 
+    SMERegistration,
+    SMEResponse,
     AuditTrailResponse,
     VerificationResponse,
     UploadResponse
@@ -37,13 +42,169 @@ security = HTTPBearer()
 # IPFS client
 ipfs_client = None
 
+# Wallet format enforced at the routing layer: malformed addresses are
+# rejected before they can consume a pooled DB connection
+WALLET_PATTERN = r"^0x[0-9a-fA-F]{40}$"
+
+# Audit-log write batching: endpoints enqueue rows and a single background
+# task flushes them with one executemany INSERT, so the hot request path
+# never pays an extra INSERT + COMMIT round-trip
+_audit_queue: Optional[asyncio.Queue] = None
+_AUDIT_BATCH_SIZE = 256
+_AUDIT_FLUSH_DELAY = 0.1  # seconds to wait for more rows before flushing
+
+# Authorization rarely changes after registration, so a generous TTL here
+# spares the upload path a chain RPC round-trip per file
+_auth_cache: TTLCache = TTLCache(maxsize=10000, ttl=300)
+
+# Nearly every endpoint starts by resolving the SME from its wallet; the
+# record changes rarely, so a short-TTL cache drops that query from the
+# common path
+SMEInfo = namedtuple(
+    "SMEInfo",
+    ("id", "company_name", "is_active", "subscription_tier",
+     "registration_date", "wallet_address")
+)
+_sme_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+async def get_sme_by_wallet(db: AsyncSession, wallet_address: str) -> Optional[SMEInfo]:
+    """Resolve an SME by wallet address through the TTL cache.
+
+    Misses are cached as None, so repeated requests for an unknown wallet
+    don't each pay a DB round-trip; registration pops the entry.
+    """
+    try:
+        return _sme_cache[wallet_address]
+    except KeyError:
+        pass
+    row = (await db.execute(
+        select(
+            SME.id,
+            SME.company_name,
+            SME.is_active,
+            SME.subscription_tier,
+            SME.registration_date,
+            SME.wallet_address
+        ).where(SME.wallet_address == wallet_address)
+    )).one_or_none()
+    info = SMEInfo(*row) if row is not None else None
+    _sme_cache[wallet_address] = info
+    return info
+
+# IPFS add batching: concurrent upload finalizers funnel their files into
+# one multipart /api/v0/add request over the per-worker keep-alive
+# connection instead of one HTTP round-trip each
+_ipfs_queue: Optional[asyncio.Queue] = None
+_IPFS_BATCH_SIZE = 16
+_IPFS_FLUSH_DELAY = 0.05  # seconds to wait for more files before flushing
+
+async def _ipfs_add(path: str) -> str:
+    """Queue a file for the batched IPFS flusher and await its hash"""
+    future = asyncio.get_running_loop().create_future()
+    _ipfs_queue.put_nowait((path, future))
+    return await future
+
+async def _ipfs_flusher():
+    """Background task sending queued files to IPFS in multi-file adds"""
+    loop = asyncio.get_running_loop()
+    running = True
+    while running:
+        item = await _ipfs_queue.get()
+        if item is None:
+            break
+        batch = [item]
+        deadline = loop.time() + _IPFS_FLUSH_DELAY
+        while len(batch) < _IPFS_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_ipfs_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                running = False
+                break
+            batch.append(item)
+
+        paths = [path for path, _ in batch]
+        try:
+            result = await asyncio.to_thread(ipfs_client.add, *paths)
+            if isinstance(result, dict):
+                result = [result]
+            hash_by_name = {entry["Name"]: entry["Hash"] for entry in result}
+            for path, future in batch:
+                ipfs_hash = hash_by_name.get(os.path.basename(path))
+                if ipfs_hash:
+                    future.set_result(ipfs_hash)
+                else:
+                    future.set_exception(
+                        RuntimeError(f"IPFS add returned no hash for {path}")
+                    )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+async def _check_sme_authorized(wallet_address: str) -> bool:
+    """Check on-chain SME authorization through the TTL cache"""
+    cached = _auth_cache.get(wallet_address)
+    if cached is not None:
+        return cached
+    is_authorized = await blockchain_service.is_sme_authorized(wallet_address)
+    _auth_cache[wallet_address] = is_authorized
+    return is_authorized
+
+async def _flush_audit_batch(batch: List[Dict[str, Any]]):
+    """Insert a batch of queued audit rows in one statement"""
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(AuditLog), batch)
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Failed to flush audit log batch: {str(e)}")
+
+async def _audit_flusher():
+    """Background task draining the audit queue into batched inserts"""
+    loop = asyncio.get_running_loop()
+    running = True
+    while running:
+        item = await _audit_queue.get()
+        if item is None:
+            break
+        batch = [item]
+        deadline = loop.time() + _AUDIT_FLUSH_DELAY
+        while len(batch) < _AUDIT_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_audit_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                running = False
+                break
+            batch.append(item)
+        await _flush_audit_batch(batch)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global blockchain_service, ipfs_client
-    
+    global blockchain_service, ipfs_client, _audit_queue, _ipfs_queue
+
     logger.info("🚀 Starting SME Audit Trail API...")
-    
+
+    # Start the audit-log and IPFS batching queues and their flusher tasks
+    _audit_queue = asyncio.Queue()
+    audit_task = asyncio.create_task(_audit_flusher())
+    _ipfs_queue = asyncio.Queue()
+    ipfs_task = asyncio.create_task(_ipfs_flusher())
+
+    # No shared httpx.AsyncClient: outbound HTTP goes through the
+    # blockchain service's pooled requests.Session and the batched IPFS
+    # client — there are no async HTTP callers to pool for
+
     # Initialize database
     try:
         init_database()
@@ -51,9 +212,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
     
-    # Initialize blockchain service
+    # Initialize blockchain service (shared, lazily created singleton)
     try:
-        blockchain_service = BlockchainService()
+        blockchain_service = get_blockchain_service()
         logger.info("✅ Blockchain service initialized")
     except Exception as e:
         logger.error(f"❌ Blockchain service initialization failed: {e}")
@@ -69,7 +230,11 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Cleanup
+    # Cleanup: drain remaining queued work before closing shared clients
+    await _audit_queue.put(None)
+    await audit_task
+    await _ipfs_queue.put(None)
+    await ipfs_task
     if ipfs_client:
         ipfs_client.close()
     logger.info("🛑 Application shutdown complete")
@@ -79,26 +244,31 @@ app = FastAPI(
     title="SME Audit Trail API",
     description="Blockchain-based audit trail system for Small and Medium Enterprises",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes responses several times faster than stdlib json,
+    # which matters on the large audit-trail payloads
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # React development server
-        "http://localhost:3001",  # Alternative React port
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3001"
-    ],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-)
+# CORS middleware — development only. In production nginx terminates CORS
+# and preflights (see nginx.conf), so the app skips a Python middleware
+# frame on every request.
+if os.getenv("ENV", "dev") == "dev":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            "http://localhost:3000",  # React development server
+            "http://localhost:3001",  # Alternative React port
+            "http://127.0.0.1:3000",
+            "http://127.0.0.1:3001"
+        ],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+    )
 
 # Helper functions
-async def log_audit_action(
-    db: Session,
+def log_audit_action(
     action: str,
     action_type: str,
     entity_type: str,
@@ -108,21 +278,19 @@ async def log_audit_action(
     transaction_id: int = None,
     notes: str = None
 ):
-    """Log an audit action to the database"""
+    """Queue an audit action; the background flusher batches the inserts"""
     try:
-        audit_log = AuditLog(
-            action=action,
-            action_type=action_type,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            actor_address=actor_address,
-            sme_id=sme_id,
-            transaction_id=transaction_id,
-            notes=notes,
-            status="success"
-        )
-        db.add(audit_log)
-        db.commit()
+        _audit_queue.put_nowait({
+            "action": action,
+            "action_type": action_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "actor_address": actor_address,
+            "sme_id": sme_id,
+            "transaction_id": transaction_id,
+            "notes": notes,
+            "status": "success"
+        })
     except Exception as e:
         logger.error(f"Failed to log audit action: {str(e)}")
 
@@ -139,7 +307,7 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check():
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """Comprehensive health check"""
     health_status = {
         "api": "healthy",
@@ -148,60 +316,63 @@ async def health_check():
         "ipfs": "unknown",
         "timestamp": datetime.utcnow().isoformat()
     }
-    
-    # Check database
+
+    # Check database through the injected session so the connection is
+    # always returned to the pool, even when the probe fails
     try:
-        db = next(get_db())
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         health_status["database"] = "healthy"
-        db.close()
     except Exception as e:
         health_status["database"] = f"error: {str(e)}"
-    
-    # Check blockchain
+
+    # Check blockchain (bounded so a stuck node can't hang the probe)
     if blockchain_service:
         try:
-            network_info = blockchain_service.get_network_info()
+            network_info = await asyncio.wait_for(
+                asyncio.to_thread(blockchain_service.get_network_info), timeout=1.0
+            )
             if network_info.get("connected"):
                 health_status["blockchain"] = "healthy"
             else:
                 health_status["blockchain"] = "disconnected"
         except Exception as e:
             health_status["blockchain"] = f"error: {str(e)}"
-    
+
     # Check IPFS
     if ipfs_client:
         try:
-            ipfs_client.version()
+            await asyncio.wait_for(asyncio.to_thread(ipfs_client.version), timeout=1.0)
             health_status["ipfs"] = "healthy"
         except Exception as e:
             health_status["ipfs"] = f"error: {str(e)}"
-    
+
     return health_status
 
 @app.post("/api/sme/register", response_model=SMEResponse)
 async def register_sme(
-    sme_data: SMERegistration, 
+    sme_data: SMERegistration,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Register a new SME"""
     try:
         logger.info(f"Registering new SME: {sme_data.company_name}")
-        
+
         # Check if wallet address already exists
-        existing_sme = db.query(SME).filter(
-            SME.wallet_address == sme_data.wallet_address
-        ).first()
-        
+        existing_sme = (await db.execute(
+            select(SME).where(SME.wallet_address == sme_data.wallet_address)
+        )).scalar_one_or_none()
+
         if existing_sme:
             raise HTTPException(
-                status_code=400, 
+                status_code=400,
                 detail="SME with this wallet address already registered"
             )
-        
+
         # Check if email already exists
-        existing_email = db.query(SME).filter(SME.email == sme_data.email).first()
+        existing_email = (await db.execute(
+            select(SME).where(SME.email == sme_data.email)
+        )).scalar_one_or_none()
         if existing_email:
             raise HTTPException(
                 status_code=400,
@@ -220,21 +391,22 @@ async def register_sme(
         )
         
         db.add(new_sme)
-        db.commit()
-        db.refresh(new_sme)
-        
+        await db.commit()
+        await db.refresh(new_sme)
+
+        # Drop any cached negative lookup for this wallet
+        _sme_cache.pop(sme_data.wallet_address, None)
+
         # Authorize SME on blockchain (background task)
         if blockchain_service:
             background_tasks.add_task(
                 authorize_sme_on_blockchain,
                 sme_data.wallet_address,
-                new_sme.id,
-                db
+                new_sme.id
             )
         
         # Log audit action
-        await log_audit_action(
-            db=db,
+        log_audit_action(
             action="SME Registration",
             action_type="CREATE",
             entity_type="SME",
@@ -246,7 +418,8 @@ async def register_sme(
         
         logger.info(f"✅ SME registered successfully: {new_sme.id}")
         
-        return SMEResponse(
+        # Trusted data straight from our own INSERT; skip re-validation
+        return SMEResponse.model_construct(
             id=new_sme.id,
             company_name=new_sme.company_name,
             wallet_address=new_sme.wallet_address,
@@ -260,15 +433,18 @@ async def register_sme(
         raise
     except Exception as e:
         logger.error(f"❌ Error registering SME: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
 
 @app.get("/api/dashboard/{wallet_address}")
-async def get_dashboard_data(wallet_address: str, db: Session = Depends(get_db)):
+async def get_dashboard_data(
+    wallet_address: str = Path(pattern=WALLET_PATTERN),
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get dashboard statistics for an SME by wallet address"""
     try:
-        # Find SME by wallet address
-        sme = db.query(SME).filter(SME.wallet_address == wallet_address.lower()).first()
+        # Find SME by wallet address (cached)
+        sme = await get_sme_by_wallet(db, wallet_address.lower())
         if not sme:
             return {
                 "sme_id": None,
@@ -281,29 +457,49 @@ async def get_dashboard_data(wallet_address: str, db: Session = Depends(get_db))
                 "wallet_address": wallet_address,
                 "registered": False
             }
-        
-        # Get transaction statistics
-        transactions = db.query(Transaction).filter(Transaction.sme_id == sme.id).all()
-        
-        total_amount = sum(float(tx.amount or 0) for tx in transactions)
-        verified_count = len([tx for tx in transactions if tx.verification_status == 'verified'])
-        pending_count = len([tx for tx in transactions if tx.verification_status == 'pending'])
-        
+
+        # Aggregate the statistics in the database instead of loading every
+        # transaction row into mapper objects just to count them
+        total_count, total_amount, verified_count, pending_count = (
+            await db.execute(
+                select(
+                    func.count(),
+                    func.coalesce(cast(func.sum(Transaction.amount), Float), 0.0),
+                    func.coalesce(func.sum(case((Transaction.verification_status == "verified", 1), else_=0)), 0),
+                    func.coalesce(func.sum(case((Transaction.verification_status == "pending", 1), else_=0)), 0)
+                ).select_from(Transaction).where(Transaction.sme_id == sme.id)
+            )
+        ).one()
+
         # Get recent transactions (last 5)
-        recent_transactions = []
-        for tx in transactions[-5:]:
-            recent_transactions.append({
+        recent_rows = (await db.execute(
+            select(
+                Transaction.token_id,
+                Transaction.transaction_type,
+                cast(Transaction.amount, Float).label("amount"),
+                Transaction.created_at,
+                Transaction.verification_status
+            )
+            .where(Transaction.sme_id == sme.id)
+            .order_by(Transaction.created_at.desc())
+            .limit(5)
+        )).all()
+
+        recent_transactions = [
+            {
                 "token_id": tx.token_id,
                 "transaction_type": tx.transaction_type or "Unknown",
-                "amount": float(tx.amount or 0),
+                "amount": tx.amount or 0.0,
                 "created_at": tx.created_at.isoformat() if tx.created_at else None,
                 "verification_status": tx.verification_status or "pending"
-            })
-        
+            }
+            for tx in reversed(recent_rows)
+        ]
+
         return {
             "sme_id": sme.id,
             "company_name": sme.company_name,
-            "total_transactions": len(transactions),
+            "total_transactions": total_count,
             "total_amount": total_amount,
             "verified_transactions": verified_count,
             "pending_transactions": pending_count,
@@ -329,11 +525,14 @@ async def get_dashboard_data(wallet_address: str, db: Session = Depends(get_db))
         }
 
 @app.get("/api/audit-trail/{wallet_address}")
-async def get_audit_trail(wallet_address: str, db: Session = Depends(get_db)):
+async def get_audit_trail(
+    wallet_address: str = Path(pattern=WALLET_PATTERN),
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get audit trail for an SME by wallet address"""
     try:
-        # Find SME by wallet address
-        sme = db.query(SME).filter(SME.wallet_address == wallet_address.lower()).first()
+        # Find SME by wallet address (cached)
+        sme = await get_sme_by_wallet(db, wallet_address.lower())
         if not sme:
             return {
                 "sme_address": wallet_address,
@@ -341,25 +540,38 @@ async def get_audit_trail(wallet_address: str, db: Session = Depends(get_db)):
                 "total_transactions": 0,
                 "transactions": []
             }
-        
-        # Get all transactions for this SME
-        transactions = db.query(Transaction).filter(
-            Transaction.sme_id == sme.id
-        ).order_by(Transaction.created_at.desc()).all()
-        
-        transaction_list = []
-        for tx in transactions:
-            transaction_list.append({
+
+        # Project the response columns directly — list endpoints only emit
+        # dicts, so mapper instances and identity-map entries are wasted
+        transactions = (await db.execute(
+            select(
+                Transaction.token_id,
+                Transaction.transaction_type,
+                cast(Transaction.amount, Float).label("amount"),
+                Transaction.description,
+                Transaction.created_at,
+                Transaction.verification_status,
+                Transaction.blockchain_hash,
+                Transaction.ipfs_hash
+            )
+            .where(Transaction.sme_id == sme.id)
+            .order_by(Transaction.created_at.desc())
+        )).all()
+
+        transaction_list = [
+            {
                 "token_id": tx.token_id,
                 "transaction_type": tx.transaction_type,
-                "amount": float(tx.amount),
+                "amount": tx.amount,
                 "description": tx.description or "",
                 "created_at": tx.created_at.isoformat(),
                 "verification_status": tx.verification_status,
                 "blockchain_hash": tx.blockchain_hash,
                 "ipfs_hash": tx.ipfs_hash
-            })
-        
+            }
+            for tx in transactions
+        ]
+
         return {
             "sme_address": wallet_address,
             "company_name": sme.company_name,
@@ -371,14 +583,12 @@ async def get_audit_trail(wallet_address: str, db: Session = Depends(get_db)):
         logger.error(f"Audit trail error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-async def authorize_sme_on_blockchain(wallet_address: str, sme_id: int, db: Session):
+async def authorize_sme_on_blockchain(wallet_address: str, sme_id: int):
     """Background task to authorize SME on blockchain"""
     try:
         result = await blockchain_service.authorize_sme(wallet_address, True)
-        
-        # Log the result
-        await log_audit_action(
-            db=db,
+
+        log_audit_action(
             action="Blockchain Authorization",
             action_type="CREATE",
             entity_type="SME",
@@ -389,6 +599,7 @@ async def authorize_sme_on_blockchain(wallet_address: str, sme_id: int, db: Sess
         )
         
         if result["success"]:
+            _auth_cache[wallet_address] = True
             logger.info(f"✅ SME {sme_id} authorized on blockchain: {result['transaction_hash']}")
         else:
             logger.error(f"❌ SME {sme_id} blockchain authorization failed: {result['error']}")
@@ -396,143 +607,204 @@ async def authorize_sme_on_blockchain(wallet_address: str, sme_id: int, db: Sess
     except Exception as e:
         logger.error(f"❌ Background blockchain authorization failed: {str(e)}")
 
-@app.post("/api/transaction/upload", response_model=UploadResponse)
+async def _finalize_upload(
+    transaction_id: int,
+    tmp_path: str,
+    token_id: str,
+    wallet_address: str,
+    transaction_type: str,
+    amount_cents: int,
+    data_digest: bytes,
+    file_hash: str
+):
+    """Background task: IPFS upload and blockchain submission for an upload"""
+    try:
+        # Upload to IPFS
+        ipfs_hash = None
+        if ipfs_client:
+            try:
+                ipfs_hash = await _ipfs_add(tmp_path)
+                logger.info(f"📎 File uploaded to IPFS: {ipfs_hash}")
+            except Exception as e:
+                logger.warning(f"IPFS upload failed: {str(e)}")
+                ipfs_hash = f"local_storage_{file_hash[:16]}"
+
+        # Submit to blockchain
+        blockchain_result = None
+        if blockchain_service:
+            try:
+                blockchain_result = await blockchain_service.log_transaction(
+                    token_id=token_id,
+                    transaction_type=transaction_type,
+                    amount=amount_cents,
+                    data_hash=data_digest,
+                    ipfs_hash=ipfs_hash or "",
+                    sme_address=wallet_address
+                )
+            except Exception as e:
+                logger.error(f"❌ Blockchain submission error: {str(e)}")
+                blockchain_result = {"success": False, "error": str(e)}
+
+        # Persist the outcome with a fresh session
+        async with AsyncSessionLocal() as db:
+            transaction = (await db.execute(
+                select(Transaction).where(Transaction.id == transaction_id)
+            )).scalar_one_or_none()
+            if transaction is None:
+                return
+
+            transaction.ipfs_hash = ipfs_hash or ""
+
+            if blockchain_result and blockchain_result.get("success"):
+                transaction.blockchain_hash = blockchain_result["transaction_hash"]
+                transaction.block_number = blockchain_result["block_number"]
+                transaction.gas_used = blockchain_result["gas_used"]
+                transaction.verification_status = "verified"
+                transaction.is_verified = True
+                transaction.verification_timestamp = datetime.utcnow()
+                logger.info(f"✅ Transaction logged to blockchain: {blockchain_result['transaction_hash']}")
+            elif blockchain_result is not None:
+                transaction.verification_status = "failed"
+                logger.error(f"❌ Blockchain logging failed: {blockchain_result.get('error')}")
+
+            await db.commit()
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+@app.post("/api/transaction/upload", response_model=UploadResponse, status_code=202)
 async def upload_transaction(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     sme_id: int = Form(...),
-    wallet_address: str = Form(...),
+    wallet_address: str = Form(..., pattern=WALLET_PATTERN),
     transaction_type: str = Form(...),
-    amount: float = Form(...),
+    amount: Decimal = Form(...),
     currency: str = Form("USD"),
     description: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload transaction with file to blockchain and IPFS"""
     try:
         logger.info(f"Processing transaction upload for SME {sme_id}")
-        
-        # Validate SME exists and is active
-        sme = db.query(SME).filter(
-            SME.id == sme_id,
-            SME.wallet_address == wallet_address,
-            SME.is_active == True
-        ).first()
-        
-        if not sme:
+
+        # Validate SME exists and is active (cached lookup)
+        sme = await get_sme_by_wallet(db, wallet_address)
+
+        if not sme or sme.id != sme_id or not sme.is_active:
             raise HTTPException(
                 status_code=404,
                 detail="SME not found or inactive"
             )
         
-        # Verify SME is authorized on blockchain
+        # Verify SME is authorized on blockchain (cached)
         if blockchain_service:
-            is_authorized = await blockchain_service.is_sme_authorized(wallet_address)
+            is_authorized = await _check_sme_authorized(wallet_address)
             if not is_authorized:
                 raise HTTPException(
                     status_code=403,
                     detail="SME not authorized on blockchain"
                 )
         
-        # Read and process file
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        # Create file hash
-        file_hash = tokenization_service.create_file_hash(file_content)
-        
-        # Upload to IPFS
-        ipfs_hash = None
-        if ipfs_client:
+        # Stream the upload to a temp file, hashing incrementally, so peak
+        # memory stays at one chunk instead of the whole file. Once the
+        # background task is scheduled it owns the temp file and removes
+        # it; until then any failure — streaming, hashing, or the DB
+        # commit below — must unlink it here or it is orphaned on disk.
+        hasher = hashlib.sha256()
+        file_size = 0
+        tmp = tempfile.NamedTemporaryFile(delete=False)
+        handed_off = False
+        try:
             try:
-                ipfs_result = ipfs_client.add_bytes(file_content)
-                ipfs_hash = ipfs_result['Hash']
-                logger.info(f"📎 File uploaded to IPFS: {ipfs_hash}")
-            except Exception as e:
-                logger.warning(f"IPFS upload failed: {str(e)}")
-                ipfs_hash = f"local_storage_{file_hash[:16]}"
-        
-        # Generate token ID
-        token_id = tokenization_service.generate_token_id(
-            sme_id,
-            transaction_type,
-            datetime.utcnow()
-        )
-        
-        # Create comprehensive data hash
-        transaction_data = {
-            "token_id": token_id,
-            "sme_id": sme_id,
-            "wallet_address": wallet_address,
-            "transaction_type": transaction_type,
-            "amount": amount,
-            "currency": currency,
-            "description": description or "",
-            "file_hash": file_hash,
-            "file_name": file.filename,
-            "file_size": file_size,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        data_hash = tokenization_service.create_data_hash(transaction_data)
+                while chunk := await file.read(1 << 20):
+                    hasher.update(chunk)
+                    file_size += len(chunk)
+                    tmp.write(chunk)
+            finally:
+                tmp.close()
+
+            file_hash = hasher.hexdigest()
+
+            # Exact cents for the chain: Decimal all the way, no float
+            # detour. Same rounding as TransactionUpload.validate_amount,
+            # so a half-cent amount lands identically on every entry path
+            amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            amount_cents = int((amount * 100).to_integral_value())
+
+            # Generate token ID
+            token_id = tokenization_service.generate_token_id(
+                sme_id,
+                transaction_type,
+                datetime.utcnow()
+            )
         
-        # Store in database first
-        new_transaction = Transaction(
-            token_id=token_id,
-            sme_id=sme_id,
-            transaction_type=transaction_type,
-            amount=amount,
-            currency=currency,
-            description=description or "",
-            ipfs_hash=ipfs_hash or "",
-            data_hash=data_hash,
-            file_name=file.filename,
-            file_size=file_size,
-            file_type=file.content_type,
-            verification_status="pending"
-        )
+            # Create comprehensive data hash
+            transaction_data = {
+                "token_id": token_id,
+                "sme_id": sme_id,
+                "wallet_address": wallet_address,
+                "transaction_type": transaction_type,
+                "amount": str(amount),
+                "currency": currency,
+                "description": description or "",
+                "file_hash": file_hash,
+                "file_name": file.filename,
+                "file_size": file_size,
+                "timestamp": datetime.utcnow().isoformat()
+            }
         
-        db.add(new_transaction)
-        db.commit()
-        db.refresh(new_transaction)
+            # Raw digest for the chain, hex only for the database row
+            data_digest = tokenization_service.create_data_digest(transaction_data)
+            data_hash = f"0x{data_digest.hex()}"
         
-        # Submit to blockchain
-        blockchain_result = None
-        if blockchain_service:
-            try:
-                blockchain_result = await blockchain_service.log_transaction(
-                    token_id=token_id,
-                    transaction_type=transaction_type,
-                    amount=int(amount * 100),  # Convert to cents
-                    data_hash=data_hash,
-                    ipfs_hash=ipfs_hash or "",
-                    sme_address=wallet_address
-                )
-                
-                if blockchain_result["success"]:
-                    # Update transaction with blockchain info
-                    new_transaction.blockchain_hash = blockchain_result["transaction_hash"]
-                    new_transaction.block_number = blockchain_result["block_number"]
-                    new_transaction.gas_used = blockchain_result["gas_used"]
-                    new_transaction.verification_status = "verified"
-                    new_transaction.is_verified = True
-                    new_transaction.verification_timestamp = datetime.utcnow()
-                    
-                    db.commit()
-                    logger.info(f"✅ Transaction logged to blockchain: {blockchain_result['transaction_hash']}")
-                else:
-                    # Mark as failed but keep database record
-                    new_transaction.verification_status = "failed"
-                    db.commit()
-                    logger.error(f"❌ Blockchain logging failed: {blockchain_result['error']}")
-                    
-            except Exception as e:
-                new_transaction.verification_status = "failed"
-                db.commit()
-                logger.error(f"❌ Blockchain submission error: {str(e)}")
+            # Store in database first
+            new_transaction = Transaction(
+                token_id=token_id,
+                sme_id=sme_id,
+                transaction_type=transaction_type,
+                amount=amount,
+                currency=currency,
+                description=description or "",
+                ipfs_hash="",
+                data_hash=data_hash,
+                file_name=file.filename,
+                file_size=file_size,
+                file_type=file.content_type,
+                verification_status="pending"
+            )
         
+            db.add(new_transaction)
+            await db.commit()
+            await db.refresh(new_transaction)
+
+            # Defer the slow legs (IPFS add + block inclusion) to a background
+            # task; the caller gets the token immediately and can poll the
+            # verification status
+            background_tasks.add_task(
+                _finalize_upload,
+                new_transaction.id,
+                tmp.name,
+                token_id,
+                wallet_address,
+                transaction_type,
+                amount_cents,
+                data_digest,
+                file_hash
+            )
+
+            handed_off = True
+        finally:
+            if not handed_off:
+                try:
+                    os.unlink(tmp.name)
+                except OSError:
+                    pass
+
         # Log audit action
-        await log_audit_action(
-            db=db,
+        log_audit_action(
             action="Transaction Upload",
             action_type="CREATE",
             entity_type="TRANSACTION",
@@ -545,11 +817,11 @@ async def upload_transaction(
         
         return UploadResponse(
             success=True,
-            message="Transaction uploaded successfully",
+            message="Transaction accepted; IPFS and blockchain submission in progress",
             token_id=token_id,
             transaction_id=new_transaction.id,
             blockchain_hash=new_transaction.blockchain_hash,
-            ipfs_hash=ipfs_hash,
+            ipfs_hash=None,
             verification_status=new_transaction.verification_status
         )
         
@@ -561,50 +833,69 @@ async def upload_transaction(
 
 @app.get("/api/audit-trail/{wallet_address}", response_model=AuditTrailResponse)
 async def get_audit_trail(
-    wallet_address: str,
+    wallet_address: str = Path(pattern=WALLET_PATTERN),
     limit: Optional[int] = 100,
     offset: Optional[int] = 0,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get complete audit trail for an SME"""
     try:
         logger.info(f"Retrieving audit trail for: {wallet_address}")
-        
-        # Get SME info
-        sme = db.query(SME).filter(SME.wallet_address == wallet_address).first()
+
+        # Get SME info (cached)
+        sme = await get_sme_by_wallet(db, wallet_address)
         if not sme:
             raise HTTPException(status_code=404, detail="SME not found")
+
+        # Get the page and the total in one round-trip: a window COUNT is
+        # emitted alongside each row of the page. The amount is cast to
+        # FLOAT server-side so the response loop never touches Decimal.
+        rows = (await db.execute(
+            select(
+                Transaction.id,
+                Transaction.token_id,
+                Transaction.transaction_type,
+                cast(Transaction.amount, Float).label("amount"),
+                Transaction.currency,
+                Transaction.description,
+                Transaction.file_name,
+                Transaction.file_size,
+                Transaction.verification_status,
+                Transaction.is_verified,
+                Transaction.blockchain_hash,
+                Transaction.ipfs_hash,
+                Transaction.created_at,
+                func.count().over().label("total_count")
+            )
+            .where(Transaction.sme_id == sme.id)
+            .order_by(Transaction.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )).all()
+
+        total_count = rows[0].total_count if rows else 0
         
-        # Get transactions from database with pagination
-        transactions_query = db.query(Transaction).filter(
-            Transaction.sme_id == sme.id
-        ).order_by(Transaction.created_at.desc())
-        
-        total_count = transactions_query.count()
-        transactions = transactions_query.offset(offset).limit(limit).all()
-        
-        # Get blockchain data if available
-        blockchain_trail = []
-        if blockchain_service:
+        # Fetch only the tokens on this page from the chain, so endpoint
+        # cost stays bounded by page size rather than total trail length
+        by_token = {}
+        if blockchain_service and rows:
             try:
-                blockchain_trail = await blockchain_service.get_audit_trail(wallet_address)
+                by_token = await blockchain_service.get_tokens_by_id(
+                    [tx.token_id for tx in rows], wallet_address
+                )
             except Exception as e:
                 logger.warning(f"Failed to fetch blockchain trail: {str(e)}")
-        
+
         # Combine and format data
         combined_transactions = []
-        for tx in transactions:
-            # Find corresponding blockchain data
-            blockchain_tx = next(
-                (btx for btx in blockchain_trail if btx["tokenId"] == tx.token_id),
-                None
-            )
-            
+        for tx in rows:
+            blockchain_tx = by_token.get(tx.token_id)
+
             transaction_data = {
                 "id": tx.id,
                 "token_id": tx.token_id,
                 "transaction_type": tx.transaction_type,
-                "amount": float(tx.amount),
+                "amount": tx.amount,
                 "currency": tx.currency,
                 "description": tx.description,
                 "file_name": tx.file_name,
@@ -614,18 +905,21 @@ async def get_audit_trail(
                 "blockchain_hash": tx.blockchain_hash,
                 "ipfs_hash": tx.ipfs_hash,
                 "created_at": tx.created_at.isoformat(),
-                "blockchain_verified": blockchain_tx is not None if blockchain_tx else False
+                "blockchain_verified": blockchain_tx is not None
             }
             
             combined_transactions.append(transaction_data)
-        
-        return AuditTrailResponse(
-            sme_address=wallet_address,
-            company_name=sme.company_name,
-            total_transactions=total_count,
-            returned_transactions=len(combined_transactions),
-            transactions=combined_transactions
-        )
+
+        # Return a concrete ORJSONResponse: the rows are plain dicts that
+        # orjson encodes in one C pass, and FastAPI skips re-validating
+        # the page against the response model (kept for OpenAPI)
+        return ORJSONResponse({
+            "sme_address": wallet_address,
+            "company_name": sme.company_name,
+            "total_transactions": total_count,
+            "returned_transactions": len(combined_transactions),
+            "transactions": combined_transactions
+        })
         
     except HTTPException:
         raise
@@ -636,24 +930,37 @@ async def get_audit_trail(
 @app.post("/api/verify/{token_id}", response_model=VerificationResponse)
 async def verify_transaction(
     token_id: str,
-    wallet_address: str,
-    db: Session = Depends(get_db)
+    wallet_address: str = Query(pattern=WALLET_PATTERN),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Verify transaction authenticity"""
     try:
         logger.info(f"Verifying transaction: {token_id}")
-        
-        # Get from database
-        transaction = db.query(Transaction).filter(
-            Transaction.token_id == token_id
-        ).first()
-        
+
+        # Get the transaction with its SME in one joined round-trip,
+        # projecting columns only — this endpoint never mutates the rows
+        transaction = (await db.execute(
+            select(
+                Transaction.id,
+                Transaction.transaction_type,
+                cast(Transaction.amount, Float).label("amount"),
+                Transaction.currency,
+                Transaction.created_at,
+                Transaction.blockchain_hash,
+                Transaction.ipfs_hash,
+                Transaction.is_verified,
+                Transaction.verification_status,
+                SME.id.label("sme_id"),
+                SME.wallet_address
+            )
+            .join(SME, Transaction.sme_id == SME.id)
+            .where(Transaction.token_id == token_id)
+        )).one_or_none()
+
         if not transaction:
             raise HTTPException(status_code=404, detail="Transaction not found")
-        
-        # Get SME info
-        sme = db.query(SME).filter(SME.id == transaction.sme_id).first()
-        if not sme or sme.wallet_address != wallet_address:
+
+        if transaction.wallet_address != wallet_address:
             raise HTTPException(status_code=403, detail="Access denied")
         
         # Verify on blockchain
@@ -667,14 +974,13 @@ async def verify_transaction(
                 logger.warning(f"Blockchain verification failed: {str(e)}")
         
         # Log verification attempt
-        await log_audit_action(
-            db=db,
+        log_audit_action(
             action="Transaction Verification",
             action_type="READ",
             entity_type="TRANSACTION",
             entity_id=token_id,
             actor_address=wallet_address,
-            sme_id=sme.id,
+            sme_id=transaction.sme_id,
             transaction_id=transaction.id,
             notes="Verification request"
         )
@@ -687,7 +993,7 @@ async def verify_transaction(
             transaction_data={
                 "id": transaction.id,
                 "transaction_type": transaction.transaction_type,
-                "amount": float(transaction.amount),
+                "amount": transaction.amount,
                 "currency": transaction.currency,
                 "created_at": transaction.created_at.isoformat(),
                 "blockchain_hash": transaction.blockchain_hash,
@@ -703,24 +1009,27 @@ async def verify_transaction(
         raise HTTPException(status_code=500, detail=f"Verification failed: {str(e)}")
 
 @app.get("/api/sme/{wallet_address}/stats")
-async def get_sme_stats(wallet_address: str, db: Session = Depends(get_db)):
+async def get_sme_stats(
+    wallet_address: str = Path(pattern=WALLET_PATTERN),
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get SME statistics"""
     try:
-        sme = db.query(SME).filter(SME.wallet_address == wallet_address).first()
+        sme = await get_sme_by_wallet(db, wallet_address)
         if not sme:
             raise HTTPException(status_code=404, detail="SME not found")
-        
-        # Get transaction statistics
-        total_transactions = db.query(Transaction).filter(Transaction.sme_id == sme.id).count()
-        verified_transactions = db.query(Transaction).filter(
-            Transaction.sme_id == sme.id,
-            Transaction.is_verified == True
-        ).count()
-        
-        pending_transactions = db.query(Transaction).filter(
-            Transaction.sme_id == sme.id,
-            Transaction.verification_status == "pending"
-        ).count()
+
+        # Get transaction statistics in one conditional-aggregation query
+        # instead of three separate COUNT round-trips
+        total_transactions, verified_transactions, pending_transactions = (
+            await db.execute(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(case((Transaction.is_verified == True, 1), else_=0)), 0),
+                    func.coalesce(func.sum(case((Transaction.verification_status == "pending", 1), else_=0)), 0)
+                ).select_from(Transaction).where(Transaction.sme_id == sme.id)
+            )
+        ).one()
         
         # Get blockchain transaction count
         blockchain_count = 0
@@ -753,10 +1062,20 @@ async def get_sme_stats(wallet_address: str, db: Session = Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    # uvloop + httptools are the fast paths shipped with uvicorn[standard];
+    # a long keep-alive lets clients reuse connections instead of paying
+    # TCP/TLS setup per request. Set RELOAD=true for local development.
+    if os.getenv("RELOAD", "false").lower() == "true":
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=int(os.getenv("PORT", "8000")),
+            workers=int(os.getenv("WORKERS", "4")),
+            loop="uvloop",
+            http="httptools",
+            timeout_keep_alive=75,
+            proxy_headers=True,
+            log_level="info"
+        )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, DECIMAL, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -33,7 +33,7 @@ class Transaction(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     token_id = Column(String(255), unique=True, nullable=False, index=True)
-    sme_id = Column(Integer, ForeignKey("smes.id"), nullable=False, index=True)
+    sme_id = Column(Integer, ForeignKey("smes.id"), nullable=False)
     transaction_type = Column(String(100), nullable=False, index=True)
     amount = Column(DECIMAL(15, 2), nullable=False)
     currency = Column(String(10), default="USD", nullable=False)
@@ -64,6 +64,17 @@ class Transaction(Base):
     sme = relationship("SME", back_populates="transactions")
     audit_logs = relationship("AuditLog", back_populates="transaction")
 
+    # Composite indexes matching the hot query shapes: audit-trail pages
+    # filter by SME and order by created_at DESC (single backward index
+    # scan instead of index scan + sort), and the stats endpoint filters
+    # by SME plus status/verified. The single-column sme_id index is
+    # covered by these prefixes.
+    __table_args__ = (
+        Index("ix_tx_sme_created", sme_id, created_at.desc()),
+        Index("ix_tx_sme_status", sme_id, verification_status),
+        Index("ix_tx_sme_verified", sme_id, is_verified),
+    )
+
 class AuditLog(Base):
     """Audit log for tracking all system activities"""
     __tablename__ = "audit_logs"
@@ -1,34 +1,73 @@
-from pydantic import BaseModel, EmailStr, validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Optional, List, Dict, Any, Literal, Union, Annotated
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+import re
+
+# Compiled once: wallet format check costs microseconds here versus a
+# wasted pooled DB connection for a lookup that can never match
+WALLET_RE = re.compile(r'^0x[0-9a-fA-F]{40}$')
+
+# Lightweight structural email check; avoids dragging in the
+# email-validator/dnspython import chain that EmailStr requires
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# 32-byte hash: the prefix/length checks alone let non-hex through
+HASH_RE = re.compile(r'^0x[0-9a-fA-F]{64}$')
+
+# Closed sets expressed as Literal types: membership is checked inside
+# pydantic-core against an interned set, not a Python validator call
+TransactionType = Literal['PAYMENT', 'INVOICE', 'EXPENSE', 'RECEIPT', 'REFUND', 'CONTRACT', 'OTHER']
+Currency = Literal['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF', 'CNY']
+SubscriptionTier = Literal['basic', 'premium', 'enterprise']
+Permission = Literal[
+    'transaction.create',
+    'transaction.read',
+    'transaction.verify',
+    'audit_trail.read',
+    'sme.read',
+    'sme.update'
+]
+OperationType = Literal['authorize_smes', 'verify_transactions', 'upload_transactions']
+
+def _now_iso() -> str:
+    """Current UTC time as ISO string, evaluated per instance"""
+    return datetime.utcnow().isoformat()
 
 class SMERegistration(BaseModel):
     """Model for SME registration request"""
     company_name: str
     wallet_address: str
-    email: EmailStr
+    email: str
     phone: Optional[str] = None
     registration_number: Optional[str] = None
     address: Optional[str] = None
-    subscription_tier: Optional[str] = "basic"
+    subscription_tier: Optional[SubscriptionTier] = "basic"
     
-    @validator('wallet_address')
+    @field_validator('wallet_address')
+    @classmethod
     def validate_wallet_address(cls, v):
-        if not v.startswith('0x') or len(v) != 42:
+        if not WALLET_RE.match(v):
             raise ValueError('Invalid Ethereum wallet address format')
         return v.lower()
     
-    @validator('company_name')
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v):
+        if not EMAIL_RE.match(v):
+            raise ValueError('Invalid email address format')
+        return v
+
+    @field_validator('company_name')
+    @classmethod
     def validate_company_name(cls, v):
         if len(v.strip()) < 2:
             raise ValueError('Company name must be at least 2 characters long')
         return v.strip()
     
-    @validator('subscription_tier')
-    def validate_subscription_tier(cls, v):
-        if v and v not in ['basic', 'premium', 'enterprise']:
-            raise ValueError('Invalid subscription tier')
+    @field_validator('subscription_tier', mode='before')
+    @classmethod
+    def default_subscription_tier(cls, v):
         return v or 'basic'
 
 class SMEResponse(BaseModel):
@@ -40,43 +79,54 @@ class SMEResponse(BaseModel):
     registration_date: datetime
     is_active: bool
     subscription_tier: str
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_db(cls, row: Dict[str, Any]) -> "SMEResponse":
+        """Assemble from a trusted DB row without re-running validation"""
+        return cls.model_construct(**row)
 
 class TransactionUpload(BaseModel):
     """Model for transaction upload metadata"""
     sme_id: int
     wallet_address: str
-    transaction_type: str
-    amount: float
-    currency: str = "USD"
+    transaction_type: TransactionType
+    amount: Decimal
+    currency: Currency = "USD"
     description: Optional[str] = None
-    
-    @validator('transaction_type')
-    def validate_transaction_type(cls, v):
-        valid_types = ['PAYMENT', 'INVOICE', 'EXPENSE', 'RECEIPT', 'REFUND', 'CONTRACT', 'OTHER']
-        if v.upper() not in valid_types:
-            raise ValueError(f'Invalid transaction type. Must be one of: {", ".join(valid_types)}')
-        return v.upper()
-    
-    @validator('amount')
+
+    @field_validator('wallet_address')
+    @classmethod
+    def validate_wallet_address(cls, v):
+        if not WALLET_RE.match(v):
+            raise ValueError('Invalid Ethereum wallet address format')
+        return v.lower()
+
+    @field_validator('transaction_type', 'currency', mode='before')
+    @classmethod
+    def uppercase_closed_sets(cls, v):
+        # Normalize case here; the Literal membership check runs in Rust
+        return v.upper() if isinstance(v, str) else v
+
+    @field_validator('amount')
+    @classmethod
     def validate_amount(cls, v):
         if v <= 0:
             raise ValueError('Amount must be greater than zero')
-        if v > 999999999.99:
+        if v > Decimal('999999999.99'):
             raise ValueError('Amount too large')
-        return round(v, 2)
-    
-    @validator('currency')
-    def validate_currency(cls, v):
-        valid_currencies = ['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF', 'CNY']
-        if v.upper() not in valid_currencies:
-            raise ValueError(f'Invalid currency. Must be one of: {", ".join(valid_currencies)}')
-        return v.upper()
+        # Decimal end-to-end: exact cents, no float rounding artifacts
+        return v.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
 class TransactionResponse(BaseModel):
-    """Model for transaction data response"""
+    """Model for transaction data response.
+
+    Kept as a BaseModel rather than a slots-backed pydantic dataclass:
+    v2 BaseModels store fields in __dict__ and only dataclasses support
+    slots=True, but switching would lose model_construct — the bigger
+    win for per-row assembly on list endpoints (see from_db below).
+    """
     id: int
     token_id: str
     transaction_type: str
@@ -91,9 +141,16 @@ class TransactionResponse(BaseModel):
     ipfs_hash: Optional[str]
     created_at: str
     blockchain_verified: bool = False
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_db(cls, row: Dict[str, Any]) -> "TransactionResponse":
+        """Assemble from a trusted DB row without re-running validation.
+
+        Only safe for data whose invariants the database already enforces.
+        """
+        return cls.model_construct(**row)
 
 class UploadResponse(BaseModel):
     """Model for file upload response"""
@@ -118,7 +175,8 @@ class VerificationRequest(BaseModel):
     token_id: str
     wallet_address: str
     
-    @validator('token_id')
+    @field_validator('token_id')
+    @classmethod
     def validate_token_id(cls, v):
         if not v or len(v.strip()) == 0:
             raise ValueError('Token ID cannot be empty')
@@ -139,9 +197,10 @@ class DataIntegrityRequest(BaseModel):
     wallet_address: str
     expected_hash: str
     
-    @validator('expected_hash')
+    @field_validator('expected_hash')
+    @classmethod
     def validate_hash(cls, v):
-        if not v.startswith('0x') or len(v) != 66:
+        if not HASH_RE.match(v):
             raise ValueError('Invalid hash format. Must be 0x followed by 64 hex characters')
         return v.lower()
 
@@ -183,6 +242,11 @@ class AuditLogResponse(BaseModel):
     status: str
     notes: Optional[str]
 
+    @classmethod
+    def from_db(cls, row: Dict[str, Any]) -> "AuditLogResponse":
+        """Assemble from a trusted DB row without re-running validation"""
+        return cls.model_construct(**row)
+
 class PaginatedResponse(BaseModel):
     """Generic model for paginated responses"""
     total_count: int
@@ -198,14 +262,16 @@ class ErrorResponse(BaseModel):
     error: bool = True
     message: str
     details: Optional[Dict[str, Any]] = None
-    timestamp: str = datetime.utcnow().isoformat()
+    # default_factory, not a class-body call: the old form froze one
+    # timestamp at import time and stamped it on every response
+    timestamp: str = Field(default_factory=_now_iso)
 
 class SuccessResponse(BaseModel):
     """Model for success responses"""
     success: bool = True
     message: str
     data: Optional[Dict[str, Any]] = None
-    timestamp: str = datetime.utcnow().isoformat()
+    timestamp: str = Field(default_factory=_now_iso)
 
 class BlockchainTransactionResponse(BaseModel):
     """Model for blockchain transaction response"""
@@ -229,23 +295,8 @@ class IPFSUploadResponse(BaseModel):
 class APIKeyRequest(BaseModel):
     """Model for API key generation request"""
     sme_id: int
-    permissions: List[str]
+    permissions: List[Permission]
     expires_in_days: Optional[int] = 365
-    
-    @validator('permissions')
-    def validate_permissions(cls, v):
-        valid_permissions = [
-            'transaction.create',
-            'transaction.read',
-            'transaction.verify',
-            'audit_trail.read',
-            'sme.read',
-            'sme.update'
-        ]
-        for permission in v:
-            if permission not in valid_permissions:
-                raise ValueError(f'Invalid permission: {permission}')
-        return v
 
 class APIKeyResponse(BaseModel):
     """Model for API key response"""
@@ -254,17 +305,46 @@ class APIKeyResponse(BaseModel):
     permissions: List[str]
     is_active: bool
 
+class AuthorizeSMEItem(BaseModel):
+    """Batch item: authorize an SME wallet on the blockchain"""
+    kind: Literal['authorize_sme'] = 'authorize_sme'
+    wallet_address: str
+    authorized: bool = True
+
+    @field_validator('wallet_address')
+    @classmethod
+    def validate_wallet_address(cls, v):
+        if not WALLET_RE.match(v):
+            raise ValueError('Invalid Ethereum wallet address format')
+        return v.lower()
+
+class VerifyTransactionItem(BaseModel):
+    """Batch item: verify a transaction token"""
+    kind: Literal['verify_transaction'] = 'verify_transaction'
+    token_id: str
+    wallet_address: str
+
+class UploadTransactionItem(BaseModel):
+    """Batch item: transaction metadata for a bulk upload"""
+    kind: Literal['upload_transaction'] = 'upload_transaction'
+    sme_id: int
+    wallet_address: str
+    transaction_type: TransactionType
+    amount: Decimal
+    currency: Currency = "USD"
+    description: Optional[str] = None
+
+# Tag-dispatched in pydantic-core: one validation pass per item instead
+# of accepting raw dicts and re-checking them in the batch handler
+BatchItem = Annotated[
+    Union[AuthorizeSMEItem, VerifyTransactionItem, UploadTransactionItem],
+    Field(discriminator='kind')
+]
+
 class BatchOperationRequest(BaseModel):
     """Model for batch operations request"""
-    operation_type: str
-    items: List[Dict[str, Any]]
-    
-    @validator('operation_type')
-    def validate_operation_type(cls, v):
-        valid_operations = ['authorize_smes', 'verify_transactions', 'upload_transactions']
-        if v not in valid_operations:
-            raise ValueError(f'Invalid operation type: {v}')
-        return v
+    operation_type: OperationType
+    items: List[BatchItem]
 
 class BatchOperationResponse(BaseModel):
     """Model for batch operations response"""
@@ -1,12 +1,53 @@
+import functools
 import hashlib
-import uuid
+import hmac
+import re
+import secrets
 from datetime import datetime
 from typing import Dict, Any
 import json
 import logging
 
+try:
+    # C-level JSON serialization for the hashing hot path; output must be
+    # byte-identical to the stdlib fallback below or digests diverge
+    # between deployments
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Full token validation in one C-level scan; the groups double as the
+# parsed components for extract_token_metadata
+# Format: TXN_YYYYMMDD_SME_ID_TYPE_HHMMSS_UUID
+_TOKEN_RE = re.compile(r'^TXN_(\d{8})_(\d+)_([^_]+)_(\d{6})_([A-Z0-9]{8})$')
+
+
+def _canonical_json(data: Dict[str, Any]) -> bytes:
+    """Serialize data to canonical sorted-key JSON bytes.
+
+    The canonical form is compact, key-sorted, raw UTF-8. ensure_ascii=False
+    keeps the stdlib fallback byte-identical to orjson, which always emits
+    raw UTF-8; without it non-ASCII text (e.g. a café in a description)
+    is \\uXXXX-escaped and the digest differs. Note this canonical form
+    differs from the pre-orjson hashes for non-ASCII payloads, which were
+    ASCII-escaped.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        data, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    ).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1024)
+def _digest_canonical(frozen: tuple) -> bytes:
+    """Digest a payload given as sorted (key, value) pairs, memoized —
+    the same dict is re-hashed on every repeat integrity check"""
+    return hashlib.sha256(_canonical_json(dict(frozen))).digest()
+
+
 class TokenizationService:
     """Service for generating unique tokens and data hashes for transactions"""
     
@@ -23,12 +64,13 @@ class TokenizationService:
         if timestamp is None:
             timestamp = datetime.utcnow()
         
-        # Create components for token ID
-        date_str = timestamp.strftime("%Y%m%d")
-        time_str = timestamp.strftime("%H%M%S")
+        # Fixed locale-independent layout: direct integer formatting
+        # skips strftime's format parsing and locale machinery
+        date_str = f"{timestamp.year:04d}{timestamp.month:02d}{timestamp.day:02d}"
+        time_str = f"{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}"
         
-        # Generate short UUID for uniqueness
-        short_uuid = str(uuid.uuid4())[:8].upper()
+        # 32 random bits hex-encoded in C — no UUID object or slicing
+        short_uuid = secrets.token_hex(4).upper()
         
         # Combine components
         token_id = f"{self.prefix}_{date_str}_{sme_id}_{transaction_type}_{time_str}_{short_uuid}"
@@ -36,115 +78,105 @@ class TokenizationService:
         logger.info(f"Generated token ID: {token_id}")
         return token_id
     
+    def create_data_digest(self, data: Dict[str, Any]) -> bytes:
+        """SHA256 digest of the canonical JSON form of transaction data.
+
+        The raw 32 bytes feed straight into blockchain submission and
+        integrity comparison; hex-encode only at the API boundary.
+        """
+        # Flat payloads with hashable values hit the memoized path;
+        # nested or unhashable values fall back to a direct hash
+        try:
+            return _digest_canonical(tuple(sorted(data.items())))
+        except TypeError:
+            return hashlib.sha256(_canonical_json(data)).digest()
+
     def create_data_hash(self, data: Dict[str, Any]) -> str:
         """Create a SHA256 hash of transaction data for integrity verification"""
         try:
-            # Convert data to JSON string with sorted keys for consistency
-            data_string = json.dumps(data, sort_keys=True, separators=(',', ':'))
-            
-            # Create SHA256 hash
-            hash_object = hashlib.sha256(data_string.encode('utf-8'))
-            data_hash = hash_object.hexdigest()
-            
+            data_hash = self.create_data_digest(data).hex()
+
             logger.info(f"Created data hash for: {list(data.keys())}")
             return f"0x{data_hash}"
-            
+
         except Exception as e:
             logger.error(f"Failed to create data hash: {str(e)}")
             raise ValueError(f"Failed to create data hash: {str(e)}")
     
-    def create_file_hash(self, file_content: bytes) -> str:
-        """Create a SHA256 hash of file content"""
+    def create_file_hash(self, file_obj) -> str:
+        """Create a SHA256 hash of file content.
+
+        Accepts a binary file object and streams it through the OpenSSL
+        fast path (hashlib.file_digest releases the GIL and never holds
+        the whole file in memory); raw bytes are still accepted for
+        callers that already have the content loaded.
+        """
         try:
-            hash_object = hashlib.sha256(file_content)
-            file_hash = hash_object.hexdigest()
-            
+            if isinstance(file_obj, (bytes, bytearray, memoryview)):
+                file_hash = hashlib.sha256(file_obj).hexdigest()
+            else:
+                file_hash = hashlib.file_digest(file_obj, 'sha256').hexdigest()
+
             logger.info(f"Created file hash: {file_hash[:16]}...")
             return file_hash
-            
+
         except Exception as e:
             logger.error(f"Failed to create file hash: {str(e)}")
             raise ValueError(f"Failed to create file hash: {str(e)}")
     
     def verify_token_format(self, token_id: str) -> bool:
         """Verify that a token ID follows the expected format"""
-        try:
-            parts = token_id.split('_')
-            
-            # Expected format: TXN_YYYYMMDD_SME_ID_TYPE_HHMMSS_UUID
-            if len(parts) != 6:
-                return False
-            
-            # Check prefix
-            if parts[0] != self.prefix:
-                return False
-            
-            # Check date format (YYYYMMDD)
-            if len(parts[1]) != 8 or not parts[1].isdigit():
-                return False
-            
-            # Check SME ID is numeric
-            if not parts[2].isdigit():
-                return False
-            
-            # Check transaction type is not empty
-            if not parts[3]:
-                return False
-            
-            # Check time format (HHMMSS)
-            if len(parts[4]) != 6 or not parts[4].isdigit():
-                return False
-            
-            # Check UUID format (8 characters)
-            if len(parts[5]) != 8:
-                return False
-            
-            return True
-            
-        except Exception:
-            return False
-    
+        return _TOKEN_RE.match(token_id) is not None
+
     def extract_token_metadata(self, token_id: str) -> Dict[str, Any]:
         """Extract metadata from a token ID"""
-        if not self.verify_token_format(token_id):
+        match = _TOKEN_RE.match(token_id)
+        if not match:
             raise ValueError("Invalid token ID format")
-        
-        parts = token_id.split('_')
-        
-        # Parse date and time
-        date_str = parts[1]
-        time_str = parts[4]
-        
+
+        date_str, sme_id, transaction_type, time_str, uid = match.groups()
+
         try:
-            timestamp = datetime.strptime(f"{date_str}{time_str}", "%Y%m%d%H%M%S")
+            # Direct slicing beats strptime's per-call format parse
+            timestamp = datetime(
+                int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]),
+                int(time_str[0:2]), int(time_str[2:4]), int(time_str[4:6])
+            )
         except ValueError:
             timestamp = None
-        
+
         return {
-            "sme_id": int(parts[2]),
-            "transaction_type": parts[3],
+            "sme_id": int(sme_id),
+            "transaction_type": transaction_type,
             "timestamp": timestamp,
-            "uuid": parts[5],
+            "uuid": uid,
             "date": date_str,
             "time": time_str
         }
     
     def generate_api_key(self, sme_id: int) -> str:
         """Generate an API key for SME access"""
-        # Create a unique identifier
-        unique_data = f"{sme_id}_{datetime.utcnow().isoformat()}_{uuid.uuid4()}"
-        
-        # Hash it
-        hash_object = hashlib.sha256(unique_data.encode('utf-8'))
+        # Feed the components straight into the digest instead of
+        # building an intermediate concatenated string
+        hash_object = hashlib.sha256()
+        hash_object.update(str(sme_id).encode('utf-8'))
+        hash_object.update(b'_')
+        hash_object.update(datetime.utcnow().isoformat().encode('utf-8'))
+        hash_object.update(b'_')
+        hash_object.update(secrets.token_hex(16).encode('utf-8'))
         api_key = f"ak_{hash_object.hexdigest()[:32]}"
-        
+
         logger.info(f"Generated API key for SME {sme_id}")
         return api_key
-    
+
     def hash_api_key(self, api_key: str) -> str:
-        """Hash an API key for secure storage"""
-        hash_object = hashlib.sha256(api_key.encode('utf-8'))
-        return hash_object.hexdigest()
+        """Hash an API key for secure storage.
+
+        Deliberately not memoized: a cache would pin plaintext keys in
+        process memory, and one SHA-256 of a short key is sub-microsecond
+        on the OpenSSL path anyway.
+        """
+        return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
     
     def validate_data_integrity(
         self, 
@@ -153,8 +185,11 @@ class TokenizationService:
     ) -> bool:
         """Validate that provided data matches the hash"""
         try:
-            calculated_hash = self.create_data_hash(original_data)
-            return calculated_hash.lower() == provided_hash.lower()
+            provided_digest = bytes.fromhex(provided_hash.removeprefix('0x'))
+            calculated_digest = self.create_data_digest(original_data)
+            # Constant-time compare on the raw digests: no hex/lower
+            # round-trips, and no timing side channel
+            return hmac.compare_digest(calculated_digest, provided_digest)
         except Exception as e:
             logger.error(f"Data integrity validation failed: {str(e)}")
             return False
\ No newline at end of file